@@ -0,0 +1,77 @@
+"""
+Derived keyword matchers for RFP Scanner.
+
+config.py stays plain, editable Python lists; this module compiles those
+lists into Aho-Corasick automata once at import time. Scoring then walks
+each document a single time instead of once per keyword (O(N) instead of
+O(K·N) per opportunity).
+"""
+
+import re
+
+import ahocorasick
+
+from config import (
+    REQUIRED_KEYWORDS,
+    BOOST_WEIGHTS,
+    NEGATIVE_KEYWORDS,
+    PROCUREMENT_PHRASES,
+    TECH_PHRASES,
+)
+
+
+def _shortest_prefix_set(keywords):
+    """
+    Drop keywords that extend a shorter keyword already in the list
+    ("case management system" is subsumed by "case management"): any text
+    containing the longer phrase necessarily contains the shorter one, so
+    only the shortest prefix of each family needs to be matched.
+    """
+    out = []
+    for kw in sorted({k.lower() for k in keywords}, key=len):
+        if not any(kw == p or kw.startswith(p + " ") for p in out):
+            out.append(kw)
+    return out
+
+
+def _build_automaton(keywords):
+    """Compile a list of phrases into a searchable Aho-Corasick automaton."""
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        kw = kw.lower()
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+# Matching is substring-based, exactly like the old `kw in text` checks.
+# Iterate with .iter(text_lower); each hit yields (end_index, keyword).
+# REQUIRED_AC matches against the prefix-reduced set, so each hit counts
+# one keyword *family* (e.g. all "case management …" variants collapse).
+REQUIRED_PREFIX_SET = _shortest_prefix_set(REQUIRED_KEYWORDS)
+
+REQUIRED_AC    = _build_automaton(REQUIRED_PREFIX_SET)
+NEGATIVE_AC    = _build_automaton(NEGATIVE_KEYWORDS)
+PROCUREMENT_AC = _build_automaton(PROCUREMENT_PHRASES)
+TECH_AC        = _build_automaton(TECH_PHRASES)
+
+# Boost keywords split into two matchers: single alphanumeric words are
+# counted by intersecting the document's token set (a hash intersection,
+# and whole-word — "state" no longer fires inside "statement"), while
+# multi-word/hyphenated phrases keep an automaton whose hits yield
+# (end_index, (keyword, weight)).
+WORD_RE = re.compile(r"[a-z0-9]+")
+
+BOOST_WORD_WEIGHTS = {}
+_boost_phrases = {}
+for _kw, _weight in BOOST_WEIGHTS.items():
+    _kw = _kw.lower()
+    if WORD_RE.fullmatch(_kw):
+        BOOST_WORD_WEIGHTS[_kw] = _weight
+    else:
+        _boost_phrases[_kw] = _weight
+
+BOOST_PHRASE_AC = ahocorasick.Automaton()
+for _kw, _weight in _boost_phrases.items():
+    BOOST_PHRASE_AC.add_word(_kw, (_kw, _weight))
+BOOST_PHRASE_AC.make_automaton()
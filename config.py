@@ -70,34 +70,36 @@ REQUIRED_KEYWORDS = [
 # ---------------------------------------------------------------------------
 # BOOST KEYWORDS
 # These raise the relevance score. Not required but helpful.
+# Each keyword carries a weight: strong procurement signals count more
+# than generic tech words. The boost contribution is capped in filters.py.
 # ---------------------------------------------------------------------------
-BOOST_KEYWORDS = [
-    "request for proposal",
-    "rfp",
-    "solicitation",
-    "procurement",
-    "bid",
-    "rfi",
-    "request for information",
-    "software",
-    "platform",
-    "system",
-    "application",
-    "saas",
-    "cloud",
-    "cloud-based",
-    "web-based",
-    "digital transformation",
-    "modernization",
-    "implementation",
-    "government",
-    "state",
-    "county",
-    "municipal",
-    "nonprofit",
-    "non-profit",
-    "agency",
-]
+BOOST_WEIGHTS = {
+    "request for proposal":     10,
+    "rfp":                      10,
+    "solicitation":              8,
+    "rfi":                       6,
+    "request for information":   6,
+    "procurement":               5,
+    "government":                4,
+    "bid":                       3,
+    "saas":                      3,
+    "digital transformation":    3,
+    "modernization":             3,
+    "cloud":                     2,
+    "cloud-based":               2,
+    "web-based":                 2,
+    "implementation":            2,
+    "state":                     2,
+    "county":                    2,
+    "municipal":                 2,
+    "nonprofit":                 2,
+    "non-profit":                2,
+    "agency":                    2,
+    "software":                  1,
+    "platform":                  1,
+    "system":                    1,
+    "application":               1,
+}
 
 # ---------------------------------------------------------------------------
 # NEGATIVE KEYWORDS
@@ -165,6 +167,10 @@ SEARCH_QUERIES = [
     '"request for proposal" "citizen portal" OR "constituent portal" software 2026',
 ]
 
+# Drop accidental duplicates while preserving order — each query is a
+# paid Serper API call.
+SEARCH_QUERIES = list(dict.fromkeys(SEARCH_QUERIES))
+
 # ---------------------------------------------------------------------------
 # BIDNET DIRECT KEYWORD SEARCHES
 # BidNet is used by hundreds of state/local agencies.
@@ -197,14 +203,45 @@ SAM_KEYWORDS = [
     "benefits administration software",
 ]
 
+# ---------------------------------------------------------------------------
+# PROCUREMENT / TECH SIGNAL PHRASES
+# Used by the scorer alongside the keyword lists above. Kept here so all
+# keyword data lives in one module and cannot drift.
+# ---------------------------------------------------------------------------
+# Procurement signal phrases (strong positive)
+PROCUREMENT_PHRASES = [
+    "request for proposal", "rfp", "solicitation", "bid", "procurement",
+    "request for information", "rfi", "request for quotation", "rfq",
+    "invitation to bid", "itb",
+]
+
+# Software/tech signal phrases (moderate positive)
+TECH_PHRASES = [
+    "software", "platform", "system", "application", "app", "portal",
+    "saas", "cloud", "cloud-based", "web-based", "digital", "technology",
+]
+
 # ---------------------------------------------------------------------------
 # SCORING THRESHOLDS
 # ---------------------------------------------------------------------------
-# Only include opportunities with a score at or above this value in the digest
-MIN_SCORE = 45
+from dataclasses import dataclass as _dataclass
+
+
+@_dataclass(frozen=True, slots=True)
+class ScoringConfig:
+    # Only include opportunities scoring at or above this in the digest
+    min_score: int = 45
+    # Look back this many days when searching (overlapping to avoid gaps)
+    lookback_days: int = 2
+
 
-# Look back this many days when searching (slightly overlapping to avoid gaps)
-LOOKBACK_DAYS = 2
+SCORING = ScoringConfig()
+
+# Module-level aliases for callers that predate ScoringConfig. These are
+# snapshots — tune the dataclass defaults above, not these lines; main
+# reads SCORING directly.
+MIN_SCORE     = SCORING.min_score
+LOOKBACK_DAYS = SCORING.lookback_days
 
 # ---------------------------------------------------------------------------
 # BLOCKED DOMAINS
@@ -312,3 +349,98 @@ INFOR_PORTALS = {
     # "Colorado": "https://bids.colorado.gov",    # TLS issues as of Feb 2026
     # "Delaware": "https://bid.delaware.gov",     # connection refused as of Feb 2026
 }
+
+# ---------------------------------------------------------------------------
+# Precompiled URL-filter patterns (derived — do not edit by hand)
+#
+# Each list above is fused into a single compiled alternation so URL
+# filtering does one regex pass instead of N Python-level string checks.
+# Edit the lists; these patterns are rebuilt automatically at import.
+# ---------------------------------------------------------------------------
+import re as _re
+import sys as _sys
+
+
+def _freeze(xs):
+    """Immutable tuple of interned lowercase strings (cheap identity compares)."""
+    return tuple(_sys.intern(x.lower()) for x in xs)
+
+
+# The lists above stay plain lists in source for easy editing; freeze the
+# runtime objects so per-import allocation is minimal and repeated
+# membership checks hit CPython's interned-string fast path.
+REQUIRED_KEYWORDS    = _freeze(REQUIRED_KEYWORDS)
+BOOST_KEYWORDS       = _freeze(BOOST_WEIGHTS)   # back-compat flat view
+NEGATIVE_KEYWORDS    = _freeze(NEGATIVE_KEYWORDS)
+BIDNET_KEYWORDS      = _freeze(BIDNET_KEYWORDS)
+SAM_KEYWORDS         = _freeze(SAM_KEYWORDS)
+USASPENDING_KEYWORDS = _freeze(USASPENDING_KEYWORDS)
+PROCUREMENT_PHRASES  = _freeze(PROCUREMENT_PHRASES)
+TECH_PHRASES         = _freeze(TECH_PHRASES)
+FOREIGN_TLDS         = _freeze(FOREIGN_TLDS)
+JUNK_URL_PATHS       = _freeze(JUNK_URL_PATHS)
+
+# Blocked domains: exact matches hit the frozenset (one hash probe);
+# subdomains collapse to a single C-level str.endswith against the
+# dot-prefixed suffix tuple.
+BLOCKED_DOMAINS_SET = frozenset(BLOCKED_DOMAINS)
+_BLOCKED_SUFFIXES   = tuple("." + d for d in BLOCKED_DOMAINS)
+
+
+def is_blocked(host: str) -> bool:
+    """Return True if host is a blocked domain or a subdomain of one."""
+    return host in BLOCKED_DOMAINS_SET or host.endswith(_BLOCKED_SUFFIXES)
+
+
+# Foreign TLDs as a reversed-label trie: resolving a hostname takes at
+# most a couple of dict lookups regardless of how long the list grows.
+_FOREIGN_TRIE: dict = {}
+for _tld in FOREIGN_TLDS:
+    _node = _FOREIGN_TRIE
+    for _label in reversed(_tld.strip(".").split(".")):
+        _node = _node.setdefault(_label, {})
+    _node["$"] = True
+
+
+def is_foreign(host: str) -> bool:
+    """Return True if host ends in a foreign (non-US) TLD."""
+    node = _FOREIGN_TRIE
+    for label in reversed(host.split(".")):
+        node = node.get(label)
+        if node is None:
+            return False
+        if "$" in node:
+            return True
+    return False
+
+# Matches a URL path containing any junk segment.
+JUNK_PATH_RE = _re.compile(
+    "|".join(_re.escape(p) for p in JUNK_URL_PATHS)
+)
+
+# Explicit export list — config is the single source of truth for all
+# keyword/threshold data; anything consumed elsewhere is named here.
+__all__ = [
+    "REQUIRED_KEYWORDS",
+    "BOOST_WEIGHTS",
+    "BOOST_KEYWORDS",
+    "NEGATIVE_KEYWORDS",
+    "SEARCH_QUERIES",
+    "BIDNET_KEYWORDS",
+    "SAM_KEYWORDS",
+    "USASPENDING_KEYWORDS",
+    "PROCUREMENT_PHRASES",
+    "TECH_PHRASES",
+    "ScoringConfig",
+    "SCORING",
+    "MIN_SCORE",
+    "LOOKBACK_DAYS",
+    "BLOCKED_DOMAINS",
+    "BLOCKED_DOMAINS_SET",
+    "FOREIGN_TLDS",
+    "JUNK_URL_PATHS",
+    "INFOR_PORTALS",
+    "is_blocked",
+    "is_foreign",
+    "JUNK_PATH_RE",
+]
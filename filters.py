@@ -13,86 +13,127 @@ Scoring rubric (0–100):
   -instant 0 - Google result with no procurement language
 """
 
+import re
+from functools import lru_cache
 from typing import List, Dict
-from urllib.parse import urlparse
 from config import (
-    REQUIRED_KEYWORDS,
-    BOOST_KEYWORDS,
-    NEGATIVE_KEYWORDS,
-    BLOCKED_DOMAINS,
-    FOREIGN_TLDS,
-    JUNK_URL_PATHS,
+    is_foreign,
+    JUNK_PATH_RE,
+    is_blocked,
 )
+from compiled import (
+    REQUIRED_AC,
+    BOOST_WORD_WEIGHTS,
+    BOOST_PHRASE_AC,
+    NEGATIVE_AC,
+    PROCUREMENT_AC,
+    TECH_AC,
+    WORD_RE,
+)
+
+
+def _matches(automaton, text: str) -> bool:
+    """True if any keyword in the automaton occurs in text (one pass)."""
+    return next(automaton.iter(text), None) is not None
 
-# Procurement signal phrases (strong positive)
-_PROCUREMENT_TITLE = [
-    "request for proposal", "rfp", "solicitation", "bid", "procurement",
-    "request for information", "rfi", "request for quotation", "rfq",
-    "invitation to bid", "itb",
-]
 
-# Software/tech signal phrases (moderate positive)
-_TECH_SIGNALS = [
-    "software", "platform", "system", "application", "app", "portal",
-    "saas", "cloud", "cloud-based", "web-based", "digital", "technology",
-]
+# Pre-bound automaton methods: the scorer calls these per opportunity,
+# so skip the repeated LOAD_GLOBAL + method lookup in the hot path.
+_required_iter     = REQUIRED_AC.iter
+_boost_phrase_iter = BOOST_PHRASE_AC.iter
+_find_words        = WORD_RE.findall
+
 
 # Sources that are inherently procurement platforms — no need to require
 # explicit procurement language in the text since every listing is a bid.
 _PROCUREMENT_PLATFORMS = {"BidNet Direct", "OpenGov", "SAM.gov"}
 
+_WS_RE = re.compile(r"\s+")
+
+
+def normalize(s: str) -> str:
+    """Lowercase and collapse whitespace — done once per text, so every
+    keyword check afterwards touches each byte exactly once."""
+    return _WS_RE.sub(" ", s.lower())
+
 
 def _is_blocked_url(url: str) -> bool:
     """Return True if the URL should be hard-blocked before scoring."""
-    try:
-        parsed = urlparse(url.lower())
-        hostname = parsed.netloc  # e.g. "www.amazon.co.uk"
-        path     = parsed.path    # e.g. "/blog/sourcing-meaning"
-    except Exception:
-        return False
+    # Manual scheme/host/path split — we only need those two pieces, and
+    # urlparse allocates a full ParseResult per call.
+    u = url.lower()
+    i = u.find("://")
+    if i >= 0:
+        j = u.find("/", i + 3)
+        if j > 0:
+            hostname = u[i + 3:j]   # e.g. "www.amazon.co.uk"
+            path     = u[j:]        # e.g. "/blog/sourcing-meaning"
+        else:
+            hostname = u[i + 3:]
+            path     = "/"
+    else:
+        # Scheme-less string: no reliable hostname; still path-check it.
+        hostname = ""
+        path     = u
 
     # Strip leading "www."
     bare = hostname.removeprefix("www.")
 
     # 1. Blocked domains (exact match or subdomain)
-    for blocked in BLOCKED_DOMAINS:
-        if bare == blocked or bare.endswith(f".{blocked}"):
-            return True
+    if is_blocked(bare):
+        return True
 
     # 2. Foreign TLDs
-    for tld in FOREIGN_TLDS:
-        if bare.endswith(tld):
-            return True
+    if is_foreign(bare):
+        return True
 
     # 3. Junk URL path patterns
     # Ensure path has trailing slash for substring matching
     path_check = path if path.endswith("/") else path + "/"
-    for pattern in JUNK_URL_PATHS:
-        if pattern in path_check:
-            return True
+    if JUNK_PATH_RE.search(path_check):
+        return True
 
     return False
 
 
 def score_opportunity(opp: Dict) -> int:
     """Return a relevance score 0–100 for an opportunity."""
-    title_raw = opp.get("title", "")
-    desc_raw  = opp.get("description", "") or opp.get("agency", "")
-    full_text = f"{title_raw} {desc_raw}".lower()
-    title_lc  = title_raw.lower()
-    url       = opp.get("url", "")
-    source    = opp.get("source", "")
-
-    # --- Hard block: URL-based filters ---
+    url    = opp.get("url", "")
+    source = opp.get("source", "")
+
+    # --- Hard block: URL-based filters (before any text processing) ---
     if _is_blocked_url(url):
         return 0
 
+    # The same RFP often reappears across sources with a different URL but
+    # identical text; the text half of the score is memoized on exactly the
+    # inputs it depends on (URL blocks above stay per-opp).
+    return _score_text(
+        opp.get("title", ""),
+        opp.get("description", "") or opp.get("agency", ""),
+        source in _PROCUREMENT_PLATFORMS,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _score_text(title_raw: str, desc_raw: str, is_platform: bool) -> int:
+    """Text-only scoring rubric (everything except the URL hard blocks)."""
+    # Normalize each input exactly once; keywords are pre-lowercased at
+    # config load, so no further case conversion happens below.
+    title_lc  = normalize(title_raw)
+    full_text = f"{title_lc} {normalize(desc_raw)}"
+
     # --- Hard negative: job postings ---
-    if any(neg in full_text for neg in NEGATIVE_KEYWORDS):
+    if _matches(NEGATIVE_AC, full_text):
         return 0
 
-    # --- Required keyword match ---
-    required_hits = [kw for kw in REQUIRED_KEYWORDS if kw.lower() in full_text]
+    # --- Required keyword match (one automaton pass over the text) ---
+    # Contribution caps at 60 (three distinct hits); stop scanning there.
+    required_hits = set()
+    for _, kw in _required_iter(full_text):
+        required_hits.add(kw)
+        if len(required_hits) == 3:
+            break
     if not required_hits:
         return 0
 
@@ -100,48 +141,85 @@ def score_opportunity(opp: Dict) -> int:
     # BidNet, OpenGov, and SAM.gov are procurement platforms by definition;
     # every listing there is a bid. Google results without RFP/bid language
     # are almost always news articles or vendor marketing pages.
-    if source not in _PROCUREMENT_PLATFORMS:
-        if not any(p in full_text for p in _PROCUREMENT_TITLE):
+    if not is_platform:
+        if not _matches(PROCUREMENT_AC, full_text):
             return 0
 
-    score = 0
-
-    # More matching required keywords = higher score (caps at 60)
-    score += min(len(required_hits) * 20, 60)
+    # Sections below are ordered cheapest-first (title check runs on the
+    # short title string); each stops early once its contribution caps.
+    score = len(required_hits) * 20   # capped at 60 by the break above
 
     # --- Procurement language ---
-    if any(p in title_lc for p in _PROCUREMENT_TITLE):
+    if _matches(PROCUREMENT_AC, title_lc):
         score += 25
-    elif any(p in full_text for p in _PROCUREMENT_TITLE):
+    elif _matches(PROCUREMENT_AC, full_text):
         score += 10
 
     # --- Tech/software language ---
-    if any(t in full_text for t in _TECH_SIGNALS):
+    if _matches(TECH_AC, full_text):
         score += 10
 
-    # --- Boost keywords (minor bumps) ---
-    boost_hits = sum(1 for kw in BOOST_KEYWORDS if kw.lower() in full_text)
-    score += min(boost_hits * 2, 10)
+    # --- Boost keywords (capped at +10) ---
+    # Single-word boosts: one tokenization, then a hash-set intersection.
+    words = frozenset(_find_words(full_text))
+    boost = sum(BOOST_WORD_WEIGHTS[w] for w in BOOST_WORD_WEIGHTS.keys() & words)
+
+    # Multi-word/hyphenated phrases: one automaton pass, stop at the cap.
+    if boost < 10:
+        boost_seen = set()
+        for _, (kw, w) in _boost_phrase_iter(full_text):
+            if kw not in boost_seen:
+                boost_seen.add(kw)
+                boost += w
+                if boost >= 10:
+                    break
+    score += min(boost, 10)
 
     return min(score, 100)
 
 
+def score_all(opportunities: List[Dict]) -> List[int]:
+    """Score a batch of opportunities; returns scores in input order.
+
+    The per-item work is one scorer call with everything else (global
+    lookups, list growth) hoisted out of the loop — callers should prefer
+    this over invoking score_opportunity in their own Python loop.
+    """
+    score = score_opportunity   # local binding for the hot loop
+    return [score(opp) for opp in opportunities]
+
+
+def canonical_url(url: str) -> str:
+    """Dedup key for a URL: query/fragment-free, no trailing slash, lowercase."""
+    # Cut at whichever of '?' / '#' comes first — no intermediate lists
+    # from chained str.split calls.
+    cut = url.find("?")
+    frag = url.find("#")
+    if frag != -1 and (cut == -1 or frag < cut):
+        cut = frag
+    if cut != -1:
+        url = url[:cut]
+    return url.rstrip("/").lower()
+
+
 def deduplicate(opportunities: List[Dict]) -> List[Dict]:
-    """Remove duplicate opportunities, keeping the first occurrence per URL."""
+    """Remove duplicate opportunities, keeping the first occurrence per URL.
+
+    Each surviving opp is stamped with its canonical key as "_url_key" so
+    downstream loops (scoring cache, seen-URL store) never recompute it.
+    """
     seen_urls: set = set()
     unique: List[Dict] = []
 
     for opp in opportunities:
-        # Normalize URL: strip query string and trailing slash
-        raw_url = opp.get("url", "")
-        # Keep fragment-free, query-free URL for dedup key
-        clean = raw_url.split("?")[0].split("#")[0].rstrip("/").lower()
+        clean = canonical_url(opp.get("url", ""))
 
         if not clean:
             continue
 
         if clean not in seen_urls:
             seen_urls.add(clean)
+            opp["_url_key"] = clean
             unique.append(opp)
 
     return unique
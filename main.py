@@ -17,10 +17,14 @@ Optional:
   SAM_API_KEY       — SAM.gov API key for federal opportunities
 """
 
-import json
+import itertools
+import logging
 import os
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from hashlib import blake2b
 from pathlib import Path
 
 from config import (
@@ -30,20 +34,23 @@ from config import (
     SAM_KEYWORDS,
     USASPENDING_KEYWORDS,
     INFOR_PORTALS,
-    MIN_SCORE,
+    SCORING,
     LOOKBACK_DAYS,
 )
+import orjson
+
 from sources import (
-    search_google,
-    search_bidnet,
+    search_google_all,
+    search_bidnet_all,
     search_sam_gov,
     search_opengov,
     search_tennessee,
-    search_infor_portal,
+    search_infor_portals_all,
     search_usaspending,
 )
-from filters import score_opportunity, deduplicate
+from filters import score_all, deduplicate, canonical_url
 from email_digest import send_digest
+import scorer_cache
 
 SEEN_FILE = Path("data/seen_urls.json")
 
@@ -51,41 +58,78 @@ SEEN_FILE = Path("data/seen_urls.json")
 # ---------------------------------------------------------------------------
 # Seen-URL persistence (prevents re-sending the same opportunity twice)
 # ---------------------------------------------------------------------------
+def _seen_key(url_key: str) -> str:
+    """Compact store entry for a canonical URL: 16 hex chars vs ~100 bytes."""
+    return blake2b(url_key.encode(), digest_size=8).hexdigest()
+
+
 def load_seen_urls() -> set:
     if SEEN_FILE.exists():
         try:
-            with open(SEEN_FILE) as f:
-                return set(json.load(f))
-        except (json.JSONDecodeError, IOError):
+            entries = orjson.loads(SEEN_FILE.read_bytes())
+        except (orjson.JSONDecodeError, IOError):
             return set()
+        # Older stores held full canonical URLs — hash them on the way in.
+        return {_seen_key(e) if "://" in e else e for e in entries}
     return set()
 
 
 def save_seen_urls(urls: set) -> None:
     SEEN_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(SEEN_FILE, "w") as f:
-        json.dump(sorted(urls), f, indent=2)
+    # Compact dump into a sibling temp file, then atomic rename — a crash
+    # mid-write can't truncate the history. Sorted so the committed file
+    # diffs by what actually changed.
+    fd, tmp = tempfile.mkstemp(dir=SEEN_FILE.parent, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(orjson.dumps(sorted(urls)))
+    os.replace(tmp, SEEN_FILE)
 
 
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 def main() -> None:
+    # Scraper error paths log at WARNING; keep them visible in the
+    # Actions console, indented to line up with the progress output.
+    logging.basicConfig(level=logging.WARNING, format="    %(message)s")
+
     print(f"\n{'='*55}")
     print(f"  RFP Scanner — {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'='*55}\n")
 
     seen_urls    = load_seen_urls()
-    all_raw: list  = []   # standard RFP results — go through scorer
+    # One result list per stage/query, flattened in a single pass before
+    # dedup instead of N incremental extends.
+    raw_batches: list = []
     pre_scored: list = [] # results with score already set (e.g. USASpending)
 
-    # ── 1. Google Search (Serper.dev) ──────────────────────────────────────
+    # The seven sources are independent and network-bound, so they all go
+    # onto a thread pool up front and wall time collapses to roughly the
+    # slowest source instead of the sum — one worker per source, so none
+    # of them queues. Each worker spins up its own asyncio loop for the
+    # fan-out sources; the shared sync client and the query cache are
+    # thread-safe. Results are consumed in stage order below so the
+    # console output stays deterministic.
     serper_key = os.environ.get("SERPER_API_KEY")
-    if serper_key:
+    sam_key    = os.environ.get("SAM_API_KEY")
+    pool = ThreadPoolExecutor(max_workers=7)
+    fut_google = pool.submit(
+        search_google_all, SEARCH_QUERIES, serper_key, lookback_days=LOOKBACK_DAYS
+    ) if serper_key else None
+    fut_bidnet  = pool.submit(search_bidnet_all, BIDNET_KEYWORDS)
+    fut_opengov = pool.submit(search_opengov, BIDNET_KEYWORDS)
+    fut_sam = pool.submit(
+        search_sam_gov, sam_key, SAM_KEYWORDS, lookback_days=LOOKBACK_DAYS
+    ) if sam_key else None
+    fut_tn    = pool.submit(search_tennessee, REQUIRED_KEYWORDS)
+    fut_infor = pool.submit(search_infor_portals_all, INFOR_PORTALS, REQUIRED_KEYWORDS)
+    fut_us    = pool.submit(search_usaspending, USASPENDING_KEYWORDS)
+
+    # ── 1. Google Search (Serper.dev) ──────────────────────────────────────
+    if fut_google is not None:
         print(f"[1/7] Google Search ({len(SEARCH_QUERIES)} queries via Serper.dev)…")
-        for query in SEARCH_QUERIES:
-            results = search_google(query, serper_key, lookback_days=LOOKBACK_DAYS)
-            all_raw.extend(results)
+        for query, results in fut_google.result().items():
+            raw_batches.append(results)
             if results:
                 print(f"      ✓ {len(results):>3} results  |  {query[:60]}")
     else:
@@ -93,64 +137,77 @@ def main() -> None:
 
     # ── 2. BidNet Direct ───────────────────────────────────────────────────
     print(f"\n[2/7] BidNet Direct ({len(BIDNET_KEYWORDS)} keywords)…")
-    for keyword in BIDNET_KEYWORDS:
-        results = search_bidnet(keyword)
-        all_raw.extend(results)
+    for keyword, results in fut_bidnet.result().items():
+        raw_batches.append(results)
         if results:
             print(f"      ✓ {len(results):>3} results  |  {keyword}")
 
     # ── 3. OpenGov ─────────────────────────────────────────────────────────
     print(f"\n[3/7] OpenGov Procurement…")
-    og_results = search_opengov(BIDNET_KEYWORDS)
-    all_raw.extend(og_results)
+    og_results = fut_opengov.result()
+    raw_batches.append(og_results)
     print(f"      ✓ {len(og_results)} results total")
 
     # ── 4. SAM.gov (optional) ─────────────────────────────────────────────
-    sam_key = os.environ.get("SAM_API_KEY")
-    if sam_key:
+    if fut_sam is not None:
         print(f"\n[4/7] SAM.gov ({len(SAM_KEYWORDS)} keywords)…")
-        results = search_sam_gov(sam_key, SAM_KEYWORDS, lookback_days=LOOKBACK_DAYS)
-        all_raw.extend(results)
+        results = fut_sam.result()
+        raw_batches.append(results)
         print(f"      ✓ {len(results)} results total")
     else:
         print("\n[4/7] Skipping SAM.gov (SAM_API_KEY not set — optional)")
 
     # ── 5. Tennessee Procurement (static HTML table) ───────────────────────
     print(f"\n[5/7] Tennessee Procurement…")
-    tn_results = search_tennessee(REQUIRED_KEYWORDS)
-    all_raw.extend(tn_results)
+    tn_results = fut_tn.result()
+    raw_batches.append(tn_results)
     print(f"      ✓ {len(tn_results)} results total")
 
     # ── 6. Infor/BuySpeed State Portals ───────────────────────────────────
     print(f"\n[6/7] Infor State Portals ({len(INFOR_PORTALS)} states)…")
-    for state_name, base_url in INFOR_PORTALS.items():
-        results = search_infor_portal(base_url, state_name, REQUIRED_KEYWORDS)
-        all_raw.extend(results)
+    for state_name, results in fut_infor.result().items():
+        raw_batches.append(results)
         if results:
             print(f"      ✓ {len(results):>3} results  |  {state_name}")
 
     # ── 7. USASpending.gov — Expiring Federal Contracts ───────────────────
     print(f"\n[7/7] USASpending.gov ({len(USASPENDING_KEYWORDS)} keywords)…")
-    us_results = search_usaspending(USASPENDING_KEYWORDS)
+    us_results = fut_us.result()
+    pool.shutdown()
     # Filter out already-seen contracts
     for opp in us_results:
-        url_key = opp["url"].split("?")[0].split("#")[0].rstrip("/").lower()
-        if url_key not in seen_urls:
+        url_key = canonical_url(opp["url"])
+        if _seen_key(url_key) not in seen_urls:
+            opp["_url_key"] = url_key
             pre_scored.append(opp)
     print(f"      ✓ {len(pre_scored)} new expiring contracts found")
 
     # ── Deduplicate ────────────────────────────────────────────────────────
+    all_raw = list(itertools.chain.from_iterable(raw_batches))
     print(f"\n  Raw results   : {len(all_raw)}")
     deduped = deduplicate(all_raw)
     print(f"  After dedup   : {len(deduped)}")
 
     # ── Score & filter ─────────────────────────────────────────────────────
-    scored = []
+    # Overlapping lookback windows re-fetch yesterday's docs; serve their
+    # scores from the disk cache and batch-score only the misses.
+    misses = []
     for opp in deduped:
-        opp["score"] = score_opportunity(opp)
-        url_key = opp["url"].split("?")[0].split("#")[0].rstrip("/").lower()
+        url_key = opp["_url_key"]   # stamped by deduplicate()
+        cached_score = scorer_cache.get(opp.get("source", ""), url_key)
+        if cached_score is not None:
+            opp["score"] = cached_score
+        else:
+            misses.append(opp)
+
+    for opp, score in zip(misses, score_all(misses)):
+        opp["score"] = score
+        scorer_cache.put(opp.get("source", ""), opp["_url_key"], score)
 
-        if opp["score"] >= MIN_SCORE and url_key not in seen_urls:
+    scored = []
+    min_score = SCORING.min_score   # local binding for the hot loop
+    for opp in deduped:
+        if opp["score"] >= min_score and _seen_key(opp["_url_key"]) not in seen_urls:
             scored.append(opp)
 
     scored.sort(key=lambda x: x["score"], reverse=True)
@@ -158,8 +215,12 @@ def main() -> None:
     print(f"  Expiring contracts: {len(pre_scored)}")
 
     # ── Update seen-URL store ──────────────────────────────────────────────
-    for opp in scored + pre_scored:
-        seen_urls.add(opp["url"].split("?")[0].split("#")[0].rstrip("/").lower())
+    # Canonical keys were computed once above; pop them off here so the
+    # digest renderers see clean opp dicts.
+    seen_urls.update(
+        _seen_key(opp.pop("_url_key"))
+        for opp in itertools.chain(scored, pre_scored)
+    )
     save_seen_urls(seen_urls)
 
     # ── Preview top results in console ────────────────────────────────────
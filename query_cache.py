@@ -0,0 +1,97 @@
+"""
+Persistent query-result cache for RFP Scanner.
+
+Daily runs overlap (the LOOKBACK_DAYS window), so a Serper query
+re-issued within the window returns the same paid results. Cache parsed
+results on disk keyed by a hash of the query and serve repeats from
+SQLite instead of spending another API call.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+
+import orjson
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from config import LOOKBACK_DAYS
+
+CACHE_FILE = Path("data/query_cache.sqlite3")
+
+# Entries older than the lookback window are stale by definition.
+TTL_SECONDS = LOOKBACK_DAYS * 86400
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS query_cache (
+    qhash   TEXT PRIMARY KEY,
+    payload BLOB NOT NULL,
+    ts      REAL NOT NULL
+)
+"""
+
+_conn: sqlite3.Connection = None
+
+# Sources run on worker threads (see main), so the single connection is
+# shared across threads and every statement runs under this lock.
+_lock = threading.Lock()
+
+
+def _connect() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _conn = sqlite3.connect(CACHE_FILE, check_same_thread=False)
+        _conn.execute(_SCHEMA)
+        # Purge expired entries once per run
+        _conn.execute("DELETE FROM query_cache WHERE ts < ?",
+                      (time.time() - TTL_SECONDS,))
+        _conn.commit()
+    return _conn
+
+
+def _qhash(query: str) -> str:
+    return hashlib.blake2b(query.encode(), digest_size=16).hexdigest()
+
+
+# In-memory front for the SQLite store: a query repeated within one run
+# (the same keyword can appear across sources) returns the parsed list
+# without touching disk again. TTL enforcement stays with SQLite — the
+# process never lives longer than the window.
+_mem: Dict[str, List[Dict]] = {}
+
+
+def get(query: str) -> Optional[List[Dict]]:
+    """Return cached results for a query, or None on miss/expiry."""
+    qhash = _qhash(query)
+    hit = _mem.get(qhash)
+    if hit is not None:
+        return hit
+
+    with _lock:
+        row = _connect().execute(
+            "SELECT payload, ts FROM query_cache WHERE qhash = ?",
+            (qhash,),
+        ).fetchone()
+    if row is None:
+        return None
+    payload, ts = row
+    if time.time() - ts > TTL_SECONDS:
+        return None
+    results = orjson.loads(payload)
+    _mem[qhash] = results
+    return results
+
+
+def put(query: str, results: List[Dict]) -> None:
+    """Store results for a query, replacing any previous entry."""
+    qhash = _qhash(query)
+    _mem[qhash] = results
+    with _lock:
+        conn = _connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO query_cache (qhash, payload, ts) VALUES (?, ?, ?)",
+            (qhash, orjson.dumps(results), time.time()),
+        )
+        conn.commit()
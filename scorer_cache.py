@@ -0,0 +1,97 @@
+"""
+Persistent score cache for RFP Scanner.
+
+Daily runs overlap (the LOOKBACK_DAYS window), so roughly half of each
+run's opportunities were already scored yesterday. Persist
+(source, doc URL) -> score in SQLite and skip the keyword scan on a hit.
+Entries expire after 14 days, and the whole cache is dropped whenever
+the keyword config changes so stale scores never survive tuning.
+"""
+
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+import config
+
+CACHE_FILE = Path("data/scorer_cache.sqlite3")
+
+TTL_SECONDS = 14 * 86400
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    src   TEXT NOT NULL,
+    docid TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    ts    REAL NOT NULL,
+    PRIMARY KEY (src, docid)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_conn: sqlite3.Connection = None
+
+
+def _config_fingerprint() -> str:
+    """Hash of every config input that influences a score."""
+    blob = repr((
+        config.REQUIRED_KEYWORDS,
+        config.BOOST_WEIGHTS,
+        config.NEGATIVE_KEYWORDS,
+        config.PROCUREMENT_PHRASES,
+        config.TECH_PHRASES,
+        config.BLOCKED_DOMAINS,
+        config.FOREIGN_TLDS,
+        config.JUNK_URL_PATHS,
+    )).encode()
+    return hashlib.blake2b(blob, digest_size=16).hexdigest()
+
+
+def _connect() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _conn = sqlite3.connect(CACHE_FILE)
+        _conn.executescript(_SCHEMA)
+
+        # Invalidate everything if the scoring config was edited
+        fp = _config_fingerprint()
+        row = _conn.execute(
+            "SELECT value FROM meta WHERE key = 'config_fp'"
+        ).fetchone()
+        if row is None or row[0] != fp:
+            _conn.execute("DELETE FROM scores")
+            _conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('config_fp', ?)",
+                (fp,),
+            )
+
+        # Purge expired entries once per run
+        _conn.execute("DELETE FROM scores WHERE ts < ?",
+                      (time.time() - TTL_SECONDS,))
+        _conn.commit()
+    return _conn
+
+
+def get(source: str, doc_id: str) -> Optional[int]:
+    """Return the cached score for (source, doc_id), or None on miss."""
+    row = _connect().execute(
+        "SELECT score FROM scores WHERE src = ? AND docid = ?",
+        (source, doc_id),
+    ).fetchone()
+    return row[0] if row else None
+
+
+def put(source: str, doc_id: str, score: int) -> None:
+    """Store a score, replacing any previous entry."""
+    conn = _connect()
+    conn.execute(
+        "INSERT OR REPLACE INTO scores (src, docid, score, ts) VALUES (?, ?, ?, ?)",
+        (source, doc_id, score, time.time()),
+    )
+    conn.commit()
@@ -12,14 +12,34 @@ Sources:
   - USASpending.gov expiring contracts     (no key needed)
       Surfaces federal contracts expiring within 12 months — signals upcoming RFPs
   - Virginia eVA                           (requires browser / Playwright — Phase 2)
+
+Every scraper yields plain dicts with the same shape — title, url,
+description, source, posted_date, agency (plus query for Serper). Plain
+dicts are deliberate: they serialize straight through orjson into the
+SQLite caches and feed the Jinja templates without any adapter layer,
+and CPython builds constant-key dict literals in a single bytecode op.
 """
 
+import asyncio
+import atexit
+import logging
+import os
 import re
+import threading
 import time
 import httpx
+import orjson
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Dict
+from urllib.parse import urljoin
+import soupsieve
 from bs4 import BeautifulSoup
+from lxml import etree
+
+import query_cache
+
+logger = logging.getLogger(__name__)
 
 
 # ---------------------------------------------------------------------------
@@ -33,192 +53,483 @@ _HEADERS = {
     ),
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
     "Accept-Language": "en-US,en;q=0.5",
+    # Explicitly advertise compression: the JSON APIs shrink 5-10x and the
+    # portal HTML ~4x; httpx decompresses transparently (br via brotli).
+    "Accept-Encoding": "gzip, br, deflate",
 }
 
 
+# ---------------------------------------------------------------------------
+# Concurrency — sources fan out many independent HTTP requests, so each
+# batch runs under asyncio.gather on one shared AsyncClient, bounded by a
+# semaphore so we stay inside API rate limits.
+#
+# HTML parsing runs via asyncio.to_thread rather than a process pool: the
+# lxml tree builder does its heavy lifting in C outside the GIL, so threads
+# already overlap parsing with network I/O, while worker processes would add
+# interpreter spawn + result pickling for a few dozen pages per run.
+# ---------------------------------------------------------------------------
+_ASYNC_LIMIT = 8
+
+
+# ---------------------------------------------------------------------------
+# Shared sync client — the remaining sequential scrapers (Tennessee and
+# USASpending) reuse one keep-alive HTTP/2 pool across the whole run instead
+# of paying a fresh TCP+TLS handshake per request. The fan-out sources
+# (Serper, BidNet, OpenGov, SAM.gov, Infor) run on per-call AsyncClients.
+# ---------------------------------------------------------------------------
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _client() -> httpx.Client:
+    # Sources run on worker threads; the lock keeps first-call races from
+    # leaking a second client. httpx.Client itself is thread-safe.
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            _CLIENT = httpx.Client(
+                http2=True,
+                headers=_HEADERS,
+                timeout=30,
+                follow_redirects=True,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                transport=httpx.HTTPTransport(retries=2, http2=True),
+            )
+            atexit.register(_CLIENT.close)
+        return _CLIENT
+
+
+# Per-host token buckets for the sync scrapers. Unlike a fixed time.sleep
+# after every call, a bucket lets a short burst run at full speed and only
+# sleeps out the exact deficit once the burst allowance is spent — and it
+# never waits after the final request of a loop.
+class _TokenBucket:
+    __slots__ = ("rate", "capacity", "tokens", "stamp")
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate     = rate            # tokens refilled per second
+        self.capacity = float(burst)
+        self.tokens   = float(burst)
+        self.stamp    = time.monotonic()
+
+    def acquire(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.stamp) * self.rate)
+        self.stamp = now
+        if self.tokens < 1.0:
+            time.sleep((1.0 - self.tokens) / self.rate)
+            self.stamp  = time.monotonic()
+            self.tokens = 1.0
+        self.tokens -= 1.0
+
+
+_BUCKETS = {
+    "api.usaspending.gov": _TokenBucket(rate=2.5, burst=3),
+}
+
+
+def _throttle(host: str) -> None:
+    bucket = _BUCKETS.get(host)
+    if bucket is not None:
+        bucket.acquire()
+
+
 # ---------------------------------------------------------------------------
 # Google Search via Serper.dev
 # ---------------------------------------------------------------------------
-def search_google(query: str, api_key: str, lookback_days: int = 2) -> List[Dict]:
+_SERPER_URL = "https://google.serper.dev/search"
+
+
+@lru_cache(maxsize=2)
+def _serper_headers(api_key: str) -> Dict[str, str]:
+    """One shared headers dict per API key (the fan-out reuses it per query)."""
+    return {
+        "X-API-KEY":       api_key,
+        "Content-Type":    "application/json",
+        "Accept-Encoding": "gzip, br, deflate",
+    }
+
+
+async def search_google(client: httpx.AsyncClient, query: str, api_key: str,
+                        lookback_days: int = 2) -> List[Dict]:
     """Search Google via Serper.dev and return raw results."""
+    cached = query_cache.get(query)
+    if cached is not None:
+        return cached
+
     try:
-        resp = httpx.post(
-            "https://google.serper.dev/search",
-            headers={"X-API-KEY": api_key, "Content-Type": "application/json"},
-            json={
+        resp = await client.post(
+            _SERPER_URL,
+            headers=_serper_headers(api_key),
+            # Pre-serialized with orjson; content= skips httpx's json encoder.
+            content=orjson.dumps({
                 "q": query,
                 "num": 20,
                 "tbs": f"qdr:d{lookback_days}",  # restrict to last N days
-            },
+            }),
             timeout=30,
         )
         resp.raise_for_status()
-        data = resp.json()
-
-        results = []
-        for item in data.get("organic", []):
-            results.append({
+        data = orjson.loads(resp.content)
+
+        results = [
+            {
+                # No .strip() on machine-generated fields: Serper's link is
+                # a URL, never whitespace-padded, and canonical_url normalizes
+                # it downstream anyway. Human-text fields keep theirs, which
+                # is near-free — CPython's str.strip() returns the original
+                # object when there is nothing to remove.
                 "title":       item.get("title", "").strip(),
-                "url":         item.get("link", "").strip(),
+                "url":         item.get("link", ""),
                 "description": item.get("snippet", "").strip(),
                 "source":      "Google / Serper",
                 "posted_date": item.get("date", ""),
                 "agency":      "",
                 "query":       query,
-            })
+            }
+            for item in data.get("organic", [])
+        ]
 
-        # Brief pause to be a good API citizen
-        time.sleep(0.3)
+        query_cache.put(query, results)
         return results
 
     except httpx.HTTPStatusError as e:
-        print(f"    [Serper] HTTP {e.response.status_code} for query: {query[:50]}")
+        logger.warning("[Serper] HTTP %s for query: %s", e.response.status_code, query[:50])
         return []
     except Exception as e:
-        print(f"    [Serper] Error: {e}")
+        logger.warning("[Serper] Error: %s", e)
         return []
 
 
+def search_google_all(queries: List[str], api_key: str,
+                      lookback_days: int = 2) -> Dict[str, List[Dict]]:
+    """Run every Serper query concurrently; returns {query: results}.
+
+    Queries multiplex one HTTP/2 connection, capped by the semaphore;
+    per-query failures are swallowed inside search_google (they return
+    empty lists), so one bad query never sinks the gather.
+    """
+    async def _run():
+        sem = asyncio.Semaphore(_ASYNC_LIMIT)
+
+        async def one(q):
+            async with sem:
+                return await search_google(client, q, api_key, lookback_days)
+
+        # HTTP/2 lets all in-flight queries multiplex one Serper connection.
+        async with httpx.AsyncClient(http2=True, timeout=30) as client:
+            return await asyncio.gather(*(one(q) for q in queries))
+
+    return dict(zip(queries, asyncio.run(_run())))
+
+
 # ---------------------------------------------------------------------------
 # BidNet Direct
 # ---------------------------------------------------------------------------
-def search_bidnet(keyword: str) -> List[Dict]:
+# Result rows appear either as plain table rows or as class-tagged list
+# items depending on the page variant; compile the selector union once
+# instead of re-tokenizing it on every keyword's page.
+_BIDNET_ROW_SEL = soupsieve.compile("table tbody tr, .solicitation-item, .bid-listing")
+
+_BIDNET_BASE = "https://www.bidnetdirect.com/"
+
+# Same conditional-GET scheme as Tennessee, but keyed per keyword: store
+# each results page's ETag/Last-Modified validators plus the parsed rows,
+# and let a 304 skip both the ~100 KB transfer and the parse. The page
+# changes slowly relative to the daily scrape, so most revisits are 304s.
+_BIDNET_CACHE_FILE = "data/bidnet_cache.json"
+
+
+def _load_bidnet_cache() -> Dict:
+    try:
+        with open(_BIDNET_CACHE_FILE, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+
+def _save_bidnet_cache(cache: Dict) -> None:
+    os.makedirs(os.path.dirname(_BIDNET_CACHE_FILE), exist_ok=True)
+    with open(_BIDNET_CACHE_FILE, "wb") as f:
+        f.write(orjson.dumps(cache))
+
+
+def _parse_bidnet(html: bytes) -> List[Dict]:
+    """Parse a BidNet Direct results page (sync — run off the event loop).
+
+    Takes the raw response bytes; lxml sniffs the encoding itself, which
+    skips httpx's .text decode of the whole page.
+    """
+    soup = BeautifulSoup(html, "lxml")
+    results = []
+
+    for row in _BIDNET_ROW_SEL.select(soup):
+        cells = row.find_all("td")
+        if not cells:
+            continue
+
+        link_el = row.find("a", href=True)
+        if not link_el:
+            continue
+
+        title = link_el.get_text(strip=True)
+        # urljoin handles root-relative, page-relative, and protocol-relative
+        # hrefs alike (and passes absolute URLs straight through).
+        href = urljoin(_BIDNET_BASE, link_el["href"])
+
+        # Extract and filter in one comprehension — str.join materializes a
+        # generator into a list internally anyway, so hand it the realized
+        # list and skip the intermediate cell_texts allocation.
+        description = " | ".join(
+            [t for c in cells
+             if (t := c.get_text(strip=True)) and t != title]
+        )
+
+        if title and href:
+            results.append({
+                "title":       title,
+                "url":         href,
+                "description": description[:300],
+                "source":      "BidNet Direct",
+                "posted_date": "",
+                "agency":      "",
+            })
+
+    return results
+
+
+async def search_bidnet(client: httpx.AsyncClient, keyword: str,
+                        cache: Dict) -> List[Dict]:
     """Scrape BidNet Direct public solicitations for a keyword."""
     base_url = "https://www.bidnetdirect.com/public/solicitations/open"
+    entry = cache.get(keyword, {})
+    headers = dict(_HEADERS)
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+
     try:
-        resp = httpx.get(
+        resp = await client.get(
             base_url,
             params={"keyword": keyword},
-            headers=_HEADERS,
+            headers=headers,
             timeout=30,
             follow_redirects=True,
         )
+        if resp.status_code == 304:
+            return entry.get("results", [])
         if resp.status_code != 200:
-            print(f"    [BidNet] HTTP {resp.status_code} for keyword: {keyword}")
+            logger.warning("[BidNet] HTTP %s for keyword: %s", resp.status_code, keyword)
             return []
 
-        soup = BeautifulSoup(resp.text, "html.parser")
-        results = []
+        # Parsing is the CPU-bound half of the scrape; push it onto a worker
+        # thread so it overlaps with the other keywords' network I/O.
+        results = await asyncio.to_thread(_parse_bidnet, resp.content)
+        cache[keyword] = {
+            "etag":          resp.headers.get("etag", ""),
+            "last_modified": resp.headers.get("last-modified", ""),
+            "results":       results,
+        }
+        return results
 
-        for row in soup.select("table tbody tr, .solicitation-item, .bid-listing"):
-            cells = row.find_all("td")
-            if not cells:
-                continue
+    except Exception as e:
+        logger.warning("[BidNet] Error for %r: %s", keyword, e)
+        return []
 
-            link_el = row.find("a", href=True)
-            if not link_el:
-                continue
 
-            title = link_el.get_text(strip=True)
-            href = link_el["href"]
-            if not href.startswith("http"):
-                href = f"https://www.bidnetdirect.com{href}"
+def search_bidnet_all(keywords: List[str]) -> Dict[str, List[Dict]]:
+    """Scrape every BidNet keyword concurrently; returns {keyword: results}."""
+    cache = _load_bidnet_cache()
 
-            cell_texts = [c.get_text(strip=True) for c in cells]
-            description = " | ".join(t for t in cell_texts if t and t != title)
+    async def _run():
+        sem = asyncio.Semaphore(_ASYNC_LIMIT)
 
-            if title and href:
-                results.append({
-                    "title":       title,
-                    "url":         href,
-                    "description": description[:300],
-                    "source":      "BidNet Direct",
-                    "posted_date": "",
-                    "agency":      "",
-                })
+        async def one(kw):
+            async with sem:
+                return await search_bidnet(client, kw, cache)
 
-        time.sleep(0.5)
-        return results
+        async with httpx.AsyncClient(
+            timeout=30, limits=httpx.Limits(max_connections=16)
+        ) as client:
+            return await asyncio.gather(*(one(kw) for kw in keywords))
 
-    except Exception as e:
-        print(f"    [BidNet] Error for '{keyword}': {e}")
-        return []
+    # Keyword result sets overlap (one solicitation matches several
+    # keywords); keep the first occurrence per URL so duplicates never
+    # leave this module.
+    seen: set = set()
+    out: Dict[str, List[Dict]] = {}
+    for kw, batch in zip(keywords, asyncio.run(_run())):
+        fresh: List[Dict] = []
+        for opp in batch:
+            if opp["url"] not in seen:
+                seen.add(opp["url"])
+                fresh.append(opp)
+        out[kw] = fresh
+
+    # One write for the whole run; coroutines only ever mutate their own
+    # keyword's entry, so no coordination is needed above.
+    _save_bidnet_cache(cache)
+    return out
 
 
 # ---------------------------------------------------------------------------
 # SAM.gov (Federal Opportunities API)
 # ---------------------------------------------------------------------------
-def search_sam_gov(api_key: str, keywords: List[str], lookback_days: int = 2) -> List[Dict]:
-    """Search SAM.gov for federal software procurement opportunities."""
-    posted_from = (datetime.now() - timedelta(days=lookback_days)).strftime("%m/%d/%Y")
+# SAM.gov's keywords param accepts a boolean expression, so a handful of
+# quoted terms OR'd together collapses that many requests into one. Eight
+# per request keeps the expression well under the API's query-length limit.
+_SAM_BATCH_SIZE = 8
+
+
+async def _search_sam_one(client: httpx.AsyncClient, api_key: str, kws: List[str],
+                          posted_from: str) -> List[Dict]:
+    """Query SAM.gov's opportunities API for one batch of OR'd keywords."""
     base_url = "https://api.sam.gov/opportunities/v2/search"
-    results = []
+    kw_param = " OR ".join(f'"{k}"' for k in kws)
+    # Same overlapping-window economics as Serper: a batch re-queried
+    # with the same postedFrom inside the TTL returns identical results,
+    # so serve it from the shared query cache. The date in the key rolls
+    # the cache over naturally; the key is the full OR expression, so a
+    # reshuffled keyword list invalidates cleanly.
+    cache_key = f"sam:{posted_from}:{kw_param}"
+    cached = query_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-    for kw in keywords:
-        try:
-            resp = httpx.get(
-                base_url,
-                params={
-                    "api_key":    api_key,
-                    "keywords":   kw,
-                    "postedFrom": posted_from,
-                    "limit":      25,
-                    "ptype":      "o",
-                },
-                timeout=30,
-            )
-            if resp.status_code != 200:
-                print(f"    [SAM.gov] HTTP {resp.status_code} for: {kw}")
-                continue
+    try:
+        resp = await client.get(
+            base_url,
+            params={
+                "api_key":    api_key,
+                "keywords":   kw_param,
+                "postedFrom": posted_from,
+                "limit":      200,
+                "ptype":      "o",
+            },
+            timeout=30,
+        )
+        if resp.status_code != 200:
+            logger.warning("[SAM.gov] HTTP %s for: %s", resp.status_code, kw_param)
+            return []
 
-            data = resp.json()
-            for opp in data.get("opportunitiesData", []):
-                notice_id = opp.get("noticeId", "")
-                results.append({
-                    "title":       opp.get("title", "").strip(),
-                    "url":         f"https://sam.gov/opp/{notice_id}/view",
-                    "description": opp.get("description", "")[:300].strip(),
-                    "source":      "SAM.gov",
-                    "posted_date": opp.get("postedDate", ""),
-                    "agency":      opp.get("fullParentPathName", ""),
-                })
+        data = orjson.loads(resp.content)
+        results = [
+            {
+                "title":       opp.get("title", "").strip(),
+                "url":         f"https://sam.gov/opp/{opp.get('noticeId', '')}/view",
+                # [:300] is a CPython no-op (same object back) when the
+                # description is already short; it only copies for the
+                # multi-KB descriptions it exists to cut.
+                "description": opp.get("description", "")[:300].strip(),
+                "source":      "SAM.gov",
+                "posted_date": opp.get("postedDate", ""),
+                "agency":      opp.get("fullParentPathName", ""),
+            }
+            for opp in data.get("opportunitiesData", [])
+        ]
+        query_cache.put(cache_key, results)
+        return results
 
-        except Exception as e:
-            print(f"    [SAM.gov] Error for '{kw}': {e}")
+    except Exception as e:
+        logger.warning("[SAM.gov] Error for %r: %s", kw_param, e)
+        return []
+
+
+def search_sam_gov(api_key: str, keywords: List[str], lookback_days: int = 2) -> List[Dict]:
+    """Search SAM.gov for federal software procurement opportunities —
+    keywords OR-batched, batches fetched concurrently."""
+    posted_from = (datetime.now() - timedelta(days=lookback_days)).strftime("%m/%d/%Y")
+    batches = [keywords[i:i + _SAM_BATCH_SIZE]
+               for i in range(0, len(keywords), _SAM_BATCH_SIZE)]
 
-        time.sleep(0.5)
+    async def _run():
+        sem = asyncio.Semaphore(_ASYNC_LIMIT)
 
+        async def one(kws):
+            async with sem:
+                return await _search_sam_one(client, api_key, kws, posted_from)
+
+        async with httpx.AsyncClient(timeout=30) as client:
+            return await asyncio.gather(*(one(kws) for kws in batches))
+
+    # A notice matching terms from two batches comes back in both
+    # responses — dedupe by URL before returning, same as OpenGov.
+    seen: set = set()
+    results: List[Dict] = []
+    for batch in asyncio.run(_run()):
+        for opp in batch:
+            if opp["url"] not in seen:
+                seen.add(opp["url"])
+                results.append(opp)
     return results
 
 
 # ---------------------------------------------------------------------------
 # OpenGov Procurement (public API — no key needed)
 # ---------------------------------------------------------------------------
-def search_opengov(keywords: List[str]) -> List[Dict]:
-    """Search OpenGov's public procurement API."""
-    results = []
+_OPENGOV_BASE = "https://procurement.opengov.com/"
+
+
+async def _search_opengov_one(client: httpx.AsyncClient, kw: str) -> List[Dict]:
+    """Query OpenGov's public procurement API for one keyword."""
     base_url = "https://procurement.opengov.com/api/opportunities/search"
+    try:
+        resp = await client.get(
+            base_url,
+            params={"q": kw, "status": "open", "per_page": 25},
+            headers=_HEADERS,
+            timeout=30,
+        )
+        if resp.status_code != 200:
+            return []
 
-    for kw in keywords:
-        try:
-            resp = httpx.get(
-                base_url,
-                params={"q": kw, "status": "open", "per_page": 25},
-                headers=_HEADERS,
-                timeout=30,
-            )
-            if resp.status_code != 200:
-                continue
+        data = orjson.loads(resp.content)
+        # Built as a comprehension like the other JSON sources — rows land
+        # via the specialized LIST_APPEND path instead of method calls.
+        return [
+            {
+                "title":       title.strip(),
+                "url":         urljoin(_OPENGOV_BASE, url),
+                "description": opp.get("description", "")[:300].strip(),
+                "source":      "OpenGov",
+                "posted_date": opp.get("published_at", ""),
+                "agency":      opp.get("entity_name", ""),
+            }
+            for opp in data.get("opportunities", data.get("results", []))
+            if (title := opp.get("title") or opp.get("name", ""))
+            and (url := opp.get("url") or opp.get("permalink", ""))
+        ]
 
-            data = resp.json()
-            for opp in data.get("opportunities", data.get("results", [])):
-                title = opp.get("title") or opp.get("name", "")
-                url   = opp.get("url") or opp.get("permalink", "")
-                if title and url:
-                    results.append({
-                        "title":       title.strip(),
-                        "url":         url if url.startswith("http") else f"https://procurement.opengov.com{url}",
-                        "description": opp.get("description", "")[:300].strip(),
-                        "source":      "OpenGov",
-                        "posted_date": opp.get("published_at", ""),
-                        "agency":      opp.get("entity_name", ""),
-                    })
+    except Exception as e:
+        logger.warning("[OpenGov] Error for %r: %s", kw, e)
+        return []
 
-        except Exception as e:
-            print(f"    [OpenGov] Error for '{kw}': {e}")
 
-        time.sleep(0.5)
+def search_opengov(keywords: List[str]) -> List[Dict]:
+    """Search OpenGov's public procurement API — all keywords concurrently.
 
+    Keyword result sets overlap heavily, so the merged list is deduped by
+    URL before returning.
+    """
+    async def _run():
+        sem = asyncio.Semaphore(_ASYNC_LIMIT)
+
+        async def one(kw):
+            async with sem:
+                return await _search_opengov_one(client, kw)
+
+        async with httpx.AsyncClient(timeout=30) as client:
+            return await asyncio.gather(*(one(kw) for kw in keywords))
+
+    seen: set = set()
+    results: List[Dict] = []
+    for batch in asyncio.run(_run()):
+        for opp in batch:
+            if opp["url"] not in seen:
+                seen.add(opp["url"])
+                results.append(opp)
     return results
 
 
@@ -235,67 +546,115 @@ _TN_RFP_URL = (
     "request-for-proposals--rfp--opportunities1.html"
 )
 
+_HTML_PARSER = etree.HTMLParser()
+
+# Conditional-GET cache: the page changes rarely, so we remember the last
+# ETag/Last-Modified plus the parsed results and let a 304 skip both the
+# transfer and the parse. Keywords are stored too — a keyword change
+# invalidates the cached (already filtered) results.
+_TN_CACHE_FILE = "data/tn_cache.json"
+
+
+def _load_tn_cache() -> Dict:
+    try:
+        with open(_TN_CACHE_FILE, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+
+def _save_tn_cache(cache: Dict) -> None:
+    os.makedirs(os.path.dirname(_TN_CACHE_FILE), exist_ok=True)
+    with open(_TN_CACHE_FILE, "wb") as f:
+        f.write(orjson.dumps(cache))
+
+
+def _cell_text(cell) -> str:
+    """Stripped text of a table cell (matches bs4's get_text(strip=True))."""
+    return "".join(t.strip() for t in cell.itertext())
+
 def search_tennessee(keywords: List[str]) -> List[Dict]:
     """
     Scrape Tennessee's public RFP listing page and return opportunities
     whose Event Name matches any of the supplied keywords.
     """
-    kw_lower = [kw.lower() for kw in keywords]
+    # One compiled alternation: each row costs a single C-level scan
+    # instead of K Python substring tests.
+    kw_lower = sorted(kw.lower() for kw in keywords)
+    kw_re = re.compile("|".join(map(re.escape, kw_lower)))
     results: List[Dict] = []
 
+    cache = _load_tn_cache()
+    headers = dict(_HEADERS)
+    if cache.get("keywords") == kw_lower:
+        if cache.get("etag"):
+            headers["If-None-Match"] = cache["etag"]
+        if cache.get("last_modified"):
+            headers["If-Modified-Since"] = cache["last_modified"]
+
     try:
-        resp = httpx.get(
+        resp = _client().get(
             _TN_RFP_URL,
-            headers=_HEADERS,
+            headers=headers,
             timeout=30,
             follow_redirects=True,
         )
+        if resp.status_code == 304:
+            return cache.get("results", [])
         if resp.status_code != 200:
-            print(f"    [Tennessee] HTTP {resp.status_code}")
+            logger.warning("[Tennessee] HTTP %s", resp.status_code)
             return []
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+        # The page is one big static table — walk <tr> elements directly on
+        # the lxml tree and release each row after use, instead of building
+        # a BeautifulSoup wrapper object per cell.
+        root = etree.fromstring(resp.content, _HTML_PARSER)
 
-        for table in soup.find_all("table"):
-            for row in table.find_all("tr"):
-                cells = row.find_all("td")
-                if len(cells) < 3:
-                    continue
+        for row in root.iter("tr"):
+            cells = row.findall("td")
+            if len(cells) < 3:
+                continue
 
-                # Col 2 = Event Name (0-indexed: doc-id, dates, event-name, [updated])
-                title = cells[2].get_text(strip=True)
-                if not title:
-                    continue
+            # Col 2 = Event Name (0-indexed: doc-id, dates, event-name, [updated])
+            title = _cell_text(cells[2])
+            if not title:
+                continue
 
-                # Keyword filter
-                if not any(kw in title.lower() for kw in kw_lower):
-                    continue
+            # Keyword filter first — non-matching rows cost one text read
+            if not kw_re.search(title.lower()):
+                row.clear()
+                continue
 
-                # Primary link = first <a> in the doc-id cell (PDF or detail page)
-                link_el = cells[0].find("a", href=True)
-                href = link_el["href"] if link_el else ""
-                if href.startswith("/"):
-                    href = "https://www.tn.gov" + href
-                elif not href.startswith("http"):
-                    href = _TN_RFP_URL
+            # Primary link = first <a> in the doc-id cell (PDF or detail page)
+            link_el = cells[0].find(".//a[@href]")
+            href = link_el.get("href") if link_el is not None else ""
+            # Resolved against the listing page, so page-relative hrefs land
+            # in the right directory; an empty href falls back to the page.
+            href = urljoin(_TN_RFP_URL, href) if href else _TN_RFP_URL
 
-                # Dates = col 1
-                dates = cells[1].get_text(strip=True)
+            # Dates = col 1
+            dates = _cell_text(cells[1])
 
-                results.append({
-                    "title":       title,
-                    "url":         href,
-                    "description": f"Dates: {dates}" if dates else "",
-                    "source":      "Tennessee Procurement",
-                    "posted_date": "",
-                    "agency":      "State of Tennessee",
-                })
+            results.append({
+                "title":       title,
+                "url":         href,
+                "description": f"Dates: {dates}" if dates else "",
+                "source":      "Tennessee Procurement",
+                "posted_date": "",
+                "agency":      "State of Tennessee",
+            })
+            row.clear()
 
-        time.sleep(0.5)
+        _save_tn_cache({
+            "etag":          resp.headers.get("etag", ""),
+            "last_modified": resp.headers.get("last-modified", ""),
+            "keywords":      kw_lower,
+            "results":       results,
+        })
         return results
 
     except Exception as e:
-        print(f"    [Tennessee] Error: {e}")
+        logger.warning("[Tennessee] Error: %s", e)
         return []
 
 
@@ -318,13 +677,33 @@ def search_tennessee(keywords: List[str]) -> List[Dict]:
 # verify that {base_url}/ajax.aspx/en/rfp/request_browse_public returns 200.
 # ---------------------------------------------------------------------------
 
+# Precompiled page patterns — reused across every page of every portal.
+_RE_GRID_ID      = re.compile(r"grd")
+_RE_MANAGE_LINK  = re.compile(r"process_manage_extranet")
+_RE_MAX_PAGE     = re.compile(
+    r'name=["\x27]maxpageindexbody_x_grid_grd["\x27][^>]*value=["\x27](\d+)'
+)
+_RE_HIDDEN_INPUT = re.compile(r'<input[^>]*type=["\x27]hidden["\x27][^>]*>', re.DOTALL)
+_RE_INPUT_NAME   = re.compile(r'name=["\x27]([^"\x27]+)')
+_RE_INPUT_VALUE  = re.compile(r'value=["\x27]([^"\x27]*)')
+# Single-pass variant: captures (name, value) in one findall. Relies on
+# Infor's type-name-value attribute order; the value group is mandatory,
+# so any field it can't fully capture (odd attribute order, no value
+# attribute) simply doesn't match and the count check below routes the
+# page through the order-agnostic per-field scan instead.
+_RE_HIDDEN_KV    = re.compile(
+    r'<input[^>]*?type=["\x27]hidden["\x27][^>]*?name=["\x27]([^"\x27]+)["\x27]'
+    r'[^>]*?value=["\x27]([^"\x27]*)["\x27]',
+    re.DOTALL,
+)
+
 def _infor_parse_page(html: str, base_url: str, state_name: str) -> List[Dict]:
     """Parse one page of results from an Infor procurement portal HTML fragment."""
     results: List[Dict] = []
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml")
 
     # The grid table has an id matching *grd*
-    grid = soup.find("table", id=re.compile(r"grd"))
+    grid = soup.find("table", id=_RE_GRID_ID)
     if not grid:
         return results
 
@@ -342,10 +721,10 @@ def _infor_parse_page(html: str, base_url: str, state_name: str) -> List[Dict]:
             continue
 
         # Detail link: href="/page.aspx/en/bpm/process_manage_extranet/[ID]"
-        manage_link = row.find("a", href=re.compile(r"process_manage_extranet"))
+        manage_link = row.find("a", href=_RE_MANAGE_LINK)
         if manage_link:
             href = manage_link.get("href", "")
-            opp_url = (base_url.rstrip("/") + href) if href.startswith("/") else href
+            opp_url = urljoin(base_url, href)
         else:
             opp_url = base_url.rstrip("/") + "/page.aspx/en/rfp/request_browse_public"
 
@@ -368,7 +747,8 @@ def _infor_parse_page(html: str, base_url: str, state_name: str) -> List[Dict]:
     return results
 
 
-def search_infor_portal(base_url: str, state_name: str, keywords: List[str]) -> List[Dict]:
+async def search_infor_portal(client: httpx.AsyncClient, base_url: str,
+                              state_name: str, keywords: List[str]) -> List[Dict]:
     """
     Fetch all open solicitations from an Infor/BuySpeed state portal,
     paginate through every page, and return keyword-matched opportunities.
@@ -379,66 +759,108 @@ def search_infor_portal(base_url: str, state_name: str, keywords: List[str]) ->
         "Referer":           base_url.rstrip("/") + "/page.aspx/en/rfp/request_browse_public",
         "X-Requested-With":  "XMLHttpRequest",
     }
-    kw_lower = [kw.lower() for kw in keywords]
+    kw_re = re.compile("|".join(re.escape(kw.lower()) for kw in keywords))
     all_opps: List[Dict] = []
 
     try:
         # ── Page 0: GET ──────────────────────────────────────────────────
-        resp = httpx.get(ajax_url, headers=headers, timeout=30, follow_redirects=True)
+        resp = await client.get(ajax_url, headers=headers, timeout=30,
+                                follow_redirects=True)
         if resp.status_code != 200:
-            print(f"    [{state_name}] HTTP {resp.status_code}")
+            logger.warning("[%s] HTTP %s", state_name, resp.status_code)
             return []
 
         html = resp.text
 
         # How many pages are there?
-        max_page_m = re.search(
-            r'name=["\x27]maxpageindexbody_x_grid_grd["\x27][^>]*value=["\x27](\d+)',
-            html,
-        )
+        max_page_m = _RE_MAX_PAGE.search(html)
         max_page = int(max_page_m.group(1)) if max_page_m else 0
 
-        all_opps.extend(_infor_parse_page(html, base_url, state_name))
+        all_opps.extend(await asyncio.to_thread(
+            _infor_parse_page, html, base_url, state_name
+        ))
 
         # ── Extract form data for pagination POSTs ────────────────────────
-        form_data: Dict[str, str] = {}
-        for field in re.findall(r'<input[^>]*type=["\x27]hidden["\x27][^>]*>', html, re.DOTALL):
-            name_m = re.search(r'name=["\x27]([^"\x27]+)', field)
-            val_m  = re.search(r'value=["\x27]([^"\x27]*)', field)
-            if name_m:
-                form_data[name_m.group(1)] = val_m.group(1) if val_m else ""
+        form_data: Dict[str, str] = dict(_RE_HIDDEN_KV.findall(html))
+        hidden_fields = _RE_HIDDEN_INPUT.findall(html)
+        if len(form_data) < len(hidden_fields):
+            # Fields ordered differently than type-name-value slip past the
+            # single-pass pattern — and ones it did catch may carry a bogus
+            # empty value (a value written before its name isn't captured).
+            # Rebuild the whole dict with the order-agnostic per-field scan.
+            form_data = {}
+            for field in hidden_fields:
+                name_m = _RE_INPUT_NAME.search(field)
+                if name_m:
+                    val_m = _RE_INPUT_VALUE.search(field)
+                    form_data[name_m.group(1)] = val_m.group(1) if val_m else ""
 
         # ── Pages 1..N: POST ──────────────────────────────────────────────
-        for page_idx in range(1, min(max_page + 1, 15)):   # cap at 15 pages
-            time.sleep(0.5)
-            form_data["hdnCurrentPageIndexbody_x_grid_grd"] = str(page_idx)
-
-            page_resp = httpx.post(
-                ajax_url,
-                headers={**headers, "Content-Type": "application/x-www-form-urlencoded"},
-                data=form_data,
-                timeout=30,
-                follow_redirects=True,
-            )
+        # Page 0 disclosed max_page and the form state, so the remaining
+        # pages are independent — fetch them concurrently, a few at a time
+        # per portal so we stay polite to the host.
+        post_headers = {**headers, "Content-Type": "application/x-www-form-urlencoded"}
+        sem = asyncio.Semaphore(4)
+
+        async def fetch_page(page_idx: int) -> List[Dict]:
+            async with sem:
+                page_resp = await client.post(
+                    ajax_url,
+                    headers=post_headers,
+                    data={**form_data,
+                          "hdnCurrentPageIndexbody_x_grid_grd": str(page_idx)},
+                    timeout=30,
+                    follow_redirects=True,
+                )
             if page_resp.status_code != 200:
-                break
+                return []
+            return await asyncio.to_thread(
+                _infor_parse_page, page_resp.text, base_url, state_name
+            )
 
-            all_opps.extend(_infor_parse_page(page_resp.text, base_url, state_name))
+        for page in await asyncio.gather(*(
+            fetch_page(i) for i in range(1, min(max_page + 1, 15))  # cap at 15 pages
+        )):
+            all_opps.extend(page)
 
         # ── Keyword filter ────────────────────────────────────────────────
+        # Field-at-a-time alternation scan: no joined f-string per opp, the
+        # or-chain stops at the first hit, and later fields are lowercased
+        # only when the earlier ones missed — most matches resolve on the
+        # title alone.
+        search = kw_re.search
         matched = [
             opp for opp in all_opps
-            if any(kw in f"{opp['title']} {opp.get('description','')} {opp.get('agency','')}".lower()
-                   for kw in kw_lower)
+            if search(opp["title"].lower())
+            or search(opp.get("description", "").lower())
+            or search(opp.get("agency", "").lower())
         ]
 
         return matched
 
     except Exception as e:
-        print(f"    [{state_name}] Error: {e}")
+        logger.warning("[%s] Error: %s", state_name, e)
         return []
 
 
+def search_infor_portals_all(portals: Dict[str, str],
+                             keywords: List[str]) -> Dict[str, List[Dict]]:
+    """
+    Scrape every configured Infor portal concurrently on one shared
+    HTTP/2 client (the portals all serve the same endpoint shape, so
+    multiplexed keep-alive connections amortize TLS setup); returns
+    {state_name: results}.
+    """
+    async def _run():
+        async with httpx.AsyncClient(http2=True, timeout=30) as client:
+            return await asyncio.gather(*(
+                search_infor_portal(client, base_url, state, keywords)
+                for state, base_url in portals.items()
+            ))
+
+    return dict(zip(portals, asyncio.run(_run())))
+
+
 # ---------------------------------------------------------------------------
 # USASpending.gov — Expiring Federal Contracts
 #
@@ -471,6 +893,7 @@ def search_usaspending(keywords: List[str]) -> List[Dict]:
     results: List[Dict] = []
 
     for kw in keywords:
+        _throttle("api.usaspending.gov")
         try:
             payload = {
                 "filters": {
@@ -498,16 +921,23 @@ def search_usaspending(keywords: List[str]) -> List[Dict]:
                 "order": "desc",
             }
 
-            resp = httpx.post(url, json=payload, timeout=30)
-            if resp.status_code != 200:
-                print(f"    [USASpending] HTTP {resp.status_code} for: {kw}")
-                continue
+            # Stream the body into one bytearray and hand it to orjson as-is
+            # — no intermediate bytes join and no .text charset decode.
+            # These are the largest payloads the scanner pulls. iter_bytes
+            # (not iter_raw) so the gzip/brotli encoding the shared client
+            # advertises gets decoded on the way through.
+            with _client().stream("POST", url, json=payload, timeout=30) as resp:
+                if resp.status_code != 200:
+                    logger.warning("[USASpending] HTTP %s for: %s", resp.status_code, kw)
+                    continue
+                buf = bytearray()
+                for chunk in resp.iter_bytes(chunk_size=65536):
+                    buf += chunk
 
-            text = resp.text.strip()
-            if not text:
+            if not buf.strip():
                 continue
 
-            data = resp.json()
+            data = orjson.loads(buf)
 
             for award in data.get("results", []):
                 end_date = award.get("End Date", "")
@@ -563,9 +993,7 @@ def search_usaspending(keywords: List[str]) -> List[Dict]:
                 })
 
         except Exception as e:
-            print(f"    [USASpending] Error for '{kw}': {e}")
-
-        time.sleep(0.4)
+            logger.warning("[USASpending] Error for %r: %s", kw, e)
 
     # Deduplicate by award URL
     seen: set = set()